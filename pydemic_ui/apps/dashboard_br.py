@@ -118,7 +118,7 @@ def download_data(data, cmap, where=st, **kwargs):
 
     elif opt == "pdf":
         ctx = {"sections": SECTIONS.values(), "data": data, "cmap": cmap}
-        fd = pdf_from_template("dashboard-report", ctx)
+        fd = pdf_from_template("dashboard-report", ctx, compact=True)
         st.data_anchor(fd.read(), filename=f"report-{today()}.pdf")
 
 
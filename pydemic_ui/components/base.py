@@ -22,7 +22,14 @@ def twin_component():
     """
 
     def decorator(fn):
+        cache = {}
+
         def bind(where):
+            try:
+                return cache[id(where)]
+            except KeyError:
+                pass
+
             if not (is_streamlit_main(where) or is_streamlit_sidebar(where)):
                 raise ValueError(f"cannot bind component to {where}")
 
@@ -30,8 +37,9 @@ def twin_component():
             def bound(*args, **kwargs):
                 kwargs.setdefault("where", where)
                 return fn(*args, **kwargs)
-                return fn(*args, **kwargs)
 
+            # Main module and sidebar are singletons, hence safe to key by id.
+            cache[id(where)] = bound
             return bound
 
         fn.is_sidebar_component = True
@@ -259,12 +259,11 @@ def dataframe_uri(df: pd.DataFrame, ext: str, mime_type=None, dates_format=None)
     """
 
     if dates_format:
+        df = df.copy(deep=False)
         df.index = [d.strftime(dates_format) for d in df.index]
 
     if ext == "csv":
-        fd = io.StringIO()
-        df.to_csv(fd)
-        data = fd.getvalue().encode("utf8")
+        data = df.to_csv().encode("utf8")
     elif ext == "xlsx":
         fd = io.BytesIO()
         df.to_excel(fd)
@@ -1,5 +1,7 @@
 __package__ = "pydemic_ui.components.input"
 
+from functools import lru_cache
+
 import streamlit as st
 from markdown import markdown
 
@@ -38,7 +40,7 @@ def simulation_params(
     st = where
     if title:
         st.header(str(title))
-    region = mundi.region(region)
+    region = _region(region) if isinstance(region, str) else mundi.region(region)
 
     # Durations
     period = st.slider(_("Duration (weeks)"), 1, 30, value=10) * 7
@@ -71,7 +73,7 @@ def healthcare_params(region, title=__("Hospital capacity"), occupancy=0.75, whe
         hospital_full_capacity (float): total system capacity of regular beds
     """
 
-    region = mundi.region(region)
+    region = _region(region) if isinstance(region, str) else mundi.region(region)
     where.header(str(title))
 
     def get(title, capacity, rate, key=None):
@@ -104,6 +106,15 @@ def healthcare_params(region, title=__("Hospital capacity"), occupancy=0.75, whe
     }
 
 
+#
+# Caches
+#
+@lru_cache(512)
+def _region(code):
+    """Mundi region from code."""
+    return mundi.region(code)
+
+
 if __name__ == "__main__":
     import streamlit as st
 
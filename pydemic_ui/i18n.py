@@ -1,3 +1,4 @@
+import os
 from gettext import gettext
 from pathlib import Path
 
@@ -16,7 +17,6 @@ def set_i18n(lang, language=None):
     import gettext
     import locale
     import warnings
-    import os
 
     try:
         locale.setlocale(locale.LC_ALL, lang)
@@ -28,9 +28,16 @@ def set_i18n(lang, language=None):
     gettext.bindtextdomain("messages", localedir=LOCALEDIR)
 
 
-def run():
-    import os
+def current_language():
+    """
+    Return the language set by :func:`set_i18n`, or None if it was not set.
+
+    Caches of translated content should include it in their keys.
+    """
+    return os.environ.get("LANGUAGE")
+
 
+def run():
     lang = os.environ.get("PYDEMIC_LANG") or os.environ.get("LANG")
     set_i18n(lang)
 
@@ -26,7 +26,7 @@ def ttl_cache(
     Default time-to-live cache logic.
     """
     if fn is None:
-        return lambda f: ttl_cache(f, ttl, force_streamlit, force_joblib)
+        return lambda f: ttl_cache(f, ttl, force_streamlit, force_joblib, key, **kwargs)
 
     if force_streamlit:
         return st.cache(ttl=ttl, **kwargs)(fn)
@@ -35,9 +35,9 @@ def ttl_cache(
 
     backend = os.environ.get("PYDEMIC_UI_CACHE_BACKEND", "joblib").lower()
     if backend == "joblib":
-        return ttl_cache(fn, ttl, force_joblib=True)
+        return ttl_cache(fn, ttl, force_joblib=True, key=key, **kwargs)
     elif backend == "streamlit":
-        return ttl_cache(fn, ttl, force_streamlit=True)
+        return ttl_cache(fn, ttl, force_streamlit=True, **kwargs)
     else:
         raise ValueError(f"invalid cache backend: {backend!r}")
 
@@ -1,7 +1,7 @@
 from gettext import gettext, ngettext
 from pathlib import Path
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
 from markdown import markdown
 from markupsafe import Markup
 
@@ -15,6 +15,7 @@ env = Environment(
     trim_blocks=True,
     lstrip_blocks=True,
     extensions=["jinja2.ext.i18n"],
+    bytecode_cache=FileSystemBytecodeCache(),
 )
 env.install_gettext_callables(gettext, ngettext)
 env.globals["markdown"] = markdown
@@ -1,6 +1,7 @@
 import io
 from typing import Union, Callable, Optional, Dict
 
+import geopandas
 import sidekick.api as sk
 from matplotlib import pyplot as plt
 from matplotlib.axes import Axes
@@ -27,40 +28,50 @@ class Column(sk.Record):
     positive: bool = False
 
     @timed
-    def show_choropleth(self, data, cmap="BuPu", where=st):
+    def show_choropleth(self, data, cmap="BuPu", where=st, geo=None):
         st.html(f'<div id="choropleth-{self.name}"></div>')
         where.subheader(self.title)
         if self.description:
             st.markdown(self.description)
-        data = self.render_choropleth(data, cmap, "img")
+        data = self.render_choropleth(data, cmap, "img", geo=geo)
         where.html(data)
         link = '<a href="#section" style="display: block; text-align: right;">{back}</a>'
         where.html(link.format(back=_("^ Back")))
 
-    def render_choropleth(self, data, cmap="BuPu", kind="svg"):
+    def render_choropleth(self, data, cmap="BuPu", kind="svg", geo=None):
         """
         Return a SVG string with the choropleth representing the column of data.
+
+        If given, geo must be a GeoDataFrame aligned with data and already
+        joined with the current column.
         """
         if kind == "svg":
             return get_map_pyplot(
-                data[self.name], self.name, self.title, cmap, self.positive
+                data[self.name], self.name, self.title, cmap, self.positive, geo=geo
             )
         elif kind == "img":
-            return render_svg(self.render_choropleth(data, cmap, "svg"))
+            return render_svg(self.render_choropleth(data, cmap, "svg", geo=geo))
         else:
             raise ValueError(f"invalid kind: {kind}")
 
 
+def _hash_geo(geo: geopandas.GeoDataFrame):
+    # Geometries are fixed for each region and the plotted column is already
+    # part of the cache key, hence the index is enough to identify the frame.
+    return tuple(geo.index)
+
+
 @timed
-@info.ttl_cache(force_streamlit=True)
-def get_map_pyplot(data, name, title, cmap, is_positive) -> str:
+@info.ttl_cache(force_streamlit=True, hash_funcs={geopandas.GeoDataFrame: _hash_geo})
+def get_map_pyplot(data, name, title, cmap, is_positive, geo=None) -> str:
     """
     Some message
     """
 
     with st.spinner(_('Creating plot "{title}"').format(title=title)):
-        geo = brazil_map().loc[data.index]
-        geo[name] = data
+        if geo is None:
+            geo = brazil_map().loc[data.index]
+            geo[name] = data
         ax: Axes = geo.plot(
             column=name,
             legend=True,
@@ -1,16 +1,21 @@
-from typing import Tuple, Optional, Dict
+import warnings
+from dataclasses import dataclass, field
+from typing import Tuple, Optional, Dict, Union, Callable
 
+import numpy as np
 import pandas as pd
 import sidekick.api as sk
 from pandas.io.formats.style import Styler
 
 from pydemic.utils import timed
 from .data_columns import Column, dashboard_columns
+from .geo import brazil_map
 from .. import st
-from ..i18n import _
+from ..i18n import _, current_language
 
 
-class Section(sk.Record):
+@dataclass(frozen=True)
+class Section:
     """
     Represent a section that display several columns of a dataframe.
     """
@@ -20,13 +25,41 @@ class Section(sk.Record):
     columns: Tuple[Column] = ()
     description: Optional[str] = None
 
-    def __init__(self, name, title, columns=(), description=None):
+    # Derived from columns
+    column_names: Tuple[str] = field(init=False, repr=False, compare=False)
+    column_formats: Dict[str, Union[str, Callable]] = field(
+        init=False, repr=False, compare=False
+    )
+    choropleth_columns: Tuple[Column] = field(init=False, repr=False, compare=False)
+    choropleth_names: Tuple[str] = field(init=False, repr=False, compare=False)
+    _rendered_index: Dict[Optional[str], str] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        columns = self.columns
+        choropleths = tuple(col for col in columns if not col.skip_choropleth)
+        derived = {
+            "column_names": tuple(col.name for col in columns),
+            "column_formats": {col.name: col.fmt for col in columns if col.fmt},
+            "choropleth_columns": choropleths,
+            "choropleth_names": tuple(col.name for col in choropleths),
+            "_rendered_index": {},
+        }
+        for attr, value in derived.items():
+            object.__setattr__(self, attr, value)
+
+    @classmethod
+    def from_columns(cls, name, title, columns=(), description=None) -> "Section":
+        """
+        Create section from a list of columns or names of dashboard columns.
+        """
+
         def to_col(col):
             return col if isinstance(col, Column) else col_data[col]
 
         col_data = dashboard_columns()
-        columns = tuple(map(to_col, columns))
-        super().__init__(name, title, columns, description)
+        return cls(name, title, tuple(map(to_col, columns)), description)
 
     @timed
     def show(self, data, static_table=False, download=True, where=st, **kwargs):
@@ -41,53 +74,138 @@ class Section(sk.Record):
             st.markdown(self.description)
         where.html(self.render_index())
 
-        for col in self.columns:
-            if not col.skip_choropleth:
-                col.show_choropleth(data, where=st, **kwargs)
-        display = self.display_data(data)
+        if self.choropleth_columns:
+            names = list(self.choropleth_names)
+            geo = brazil_map().loc[data.index].join(data[names])
+            for col in self.choropleth_columns:
+                col.show_choropleth(data, where=st, geo=geo, **kwargs)
+
+        # Static tables do not render most styles, so we skip the Styler
+        if static_table:
+            display = self.formatted_data(data)
+        else:
+            display = self.display_data(data)
         st.subheader(_("Raw data"))
         st.html('<div id="raw-data"></div>')
-        self.show_table(display, static_table=static_table, download=download, where=st)
+        self.show_table(
+            display,
+            static_table=static_table,
+            download=download,
+            where=st,
+            raw_data=data[list(self.column_names)],
+        )
 
     @timed
-    def show_table(self, data, static_table=False, download=True, where=st):
+    def show_table(
+        self, data, static_table=False, download=True, where=st, raw_data=None
+    ):
         """
-        Show table with data
+        Show table with data.
+
+        If given, raw_data is used in the download link instead of data.
         """
         if static_table:
             where.table(data)
         else:
             where.dataframe(data)
         if download:
-            st.data_anchor(data, f"{self.name}-data.csv")
+            if raw_data is None:
+                raw_data = data.data if isinstance(data, Styler) else data
+            st.data_anchor(raw_data, f"{self.name}-data.csv")
 
     @timed
     def display_data(self, data: pd.DataFrame) -> Styler:
         """
         Return a Styled dataframe.
         """
-        columns = [col.name for col in self.columns]
-        fmt = {col.name: col.fmt for col in self.columns if col.fmt}
-        return (
-            data[columns]
-            .style_dataframe.format(fmt, na_rep="-")
-            .highlight_max(color="red")
-            .highlight_min(color="green")
-        )
+        data = data[list(self.column_names)]
+        styler = data.style.format(self.column_formats, na_rep="-")
+        return styler.apply(_extrema_styles, axis=None)
+
+    @timed
+    def formatted_data(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Return a dataframe with the section columns formatted as strings.
+
+        This is a cheaper alternative to :meth:`display_data` for contexts
+        that do not use styles.
+        """
+        columns = {}
+        for name in self.column_names:
+            col = data[name]
+            fmt = self.column_formats.get(name)
+            if fmt is not None:
+                fmt = fmt.format if isinstance(fmt, str) else fmt
+                col = col.map(fmt, na_action="ignore").fillna("-")
+            columns[name] = col
+        return pd.DataFrame(columns, index=data.index)
 
     def render_index(self) -> str:
         """
         Render index as HTML.
+
+        The result only depends on the section and on the current language,
+        hence it is computed once per language and stored in the section.
         """
+        language = current_language()
+        try:
+            return self._rendered_index[language]
+        except KeyError:
+            pass
+
         subsections = _("Quick links")
         lines = [f'<div id="section-toc">{subsections}</div><ul>']
-        for col in self.columns:
-            if not col.skip_choropleth:
-                lines.append(f'<li><a href="#choropleth-{col.name}">{col.title}</a></li>')
+        for col in self.choropleth_columns:
+            lines.append(f'<li><a href="#choropleth-{col.name}">{col.title}</a></li>')
         raw_data = _("Raw data")
         lines.append(f'<li><a href="#raw-data">{raw_data}</a></li>')
         lines.append("</ul>")
-        return "\n".join(lines)
+        self._rendered_index[language] = html = "\n".join(lines)
+        return html
+
+
+def _hash_dataframe(df: pd.DataFrame) -> tuple:
+    values = pd.util.hash_pandas_object(df, index=True).values.tobytes()
+    return tuple(df.columns), tuple(map(str, df.dtypes)), values
+
+
+@st.cache(
+    allow_output_mutation=True,
+    show_spinner=False,
+    hash_funcs={pd.DataFrame: _hash_dataframe},
+)
+def _extrema_styles(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Cached CSS matrix computed by :func:`_highlight_extrema`.
+
+    Stylers are not cached, since Streamlit computes styles in place and
+    older versions of pandas accumulate them in a reused Styler.
+    """
+    return _highlight_extrema(data)
+
+
+def _highlight_extrema(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Highlight maximum (red) and minimum (green) values of each numeric column.
+
+    Styles are computed for the whole frame at once instead of passing
+    through highlight_max/highlight_min, which style cell-by-cell. Cells that
+    are both maximum and minimum receive both styles, in that order.
+    """
+    styles = pd.DataFrame("", index=data.index, columns=data.columns)
+    numeric = data.select_dtypes("number")
+    if numeric.empty:
+        return styles
+
+    values = numeric.to_numpy(dtype=float)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN columns
+        is_max = values == np.nanmax(values, axis=0)
+        is_min = values == np.nanmin(values, axis=0)
+    max_css = np.where(is_max, "background-color: red;", "")
+    min_css = np.where(is_min, "background-color: green", "")
+    styles[numeric.columns] = np.char.rstrip(np.char.add(max_css, min_css), ";")
+    return styles
 
 
 #
@@ -98,13 +216,13 @@ def dashboard_sections() -> Dict[str, Section]:
     return {
         sec.name: sec
         for sec in (
-            Section(
+            Section.from_columns(
                 "basic",
                 title=_("Basic information"),
                 columns=["name", "short_code", "population"],
                 description=_("Basic parameters"),
             ),
-            Section(
+            Section.from_columns(
                 "healthcare_system",
                 title=_("Healthcare system"),
                 columns=[
@@ -117,33 +235,35 @@ def dashboard_sections() -> Dict[str, Section]:
                 ],
                 description=_("Healthcare system data was collected from CNES."),
             ),
-            Section(
+            Section.from_columns(
                 "acc_cases",
                 title=_("Prevalence"),
                 columns=["cases", "prevalence", "prevalence_15d"],
             ),
-            Section(
+            Section.from_columns(
                 "acc_deaths",
                 title=_("Mortality"),
                 columns=["deaths", "mortality", "mortality_15d"],
             ),
-            Section(
+            Section.from_columns(
                 "new_cases",
                 title=_("Active cases"),
                 columns=["new_cases", "new_prevalence_today", "new_prevalence_15d"],
             ),
-            Section(
+            Section.from_columns(
                 "new_deaths",
                 title=_("Death rate"),
                 columns=["new_deaths", "new_mortality_today", "new_mortality_15d"],
             ),
-            Section("fatality", title=_("Fatality rates"), columns=["CFR", "CFR_15d"]),
-            Section(
+            Section.from_columns(
+                "fatality", title=_("Fatality rates"), columns=["CFR", "CFR_15d"]
+            ),
+            Section.from_columns(
                 "policy",
                 title=_("Policy and behavior"),
                 columns=["isolation_score", "has_lockdown", "lockdown_ratio"],
             ),
-            Section(
+            Section.from_columns(
                 "tests",
                 title=_("Testing"),
                 columns=["tests", "tests_100k", "tests_positive", "tests_positive_ratio"],
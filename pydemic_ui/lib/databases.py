@@ -1,5 +1,6 @@
 import io
 
+import numpy as np
 import pandas as pd
 import requests
 
@@ -14,18 +15,17 @@ PAHO_DATABASE_URL = "https://github.com/pydemic/databases/raw/master/paho_info.x
 @timed
 @ttl_cache("paho", timeout=6 * 3600)
 def paho_br_dataframe(sheet) -> pd.DataFrame:
-    content = paho_br_xlsx()
+    return _paho_br_dataframe(sheet, paho_br_xlsx())
+
+
+@ttl_cache("paho", timeout=6 * 3600)
+def _paho_br_dataframe(sheet, content: bytes) -> pd.DataFrame:
+    # The cache is keyed by the contents of the xlsx file: a new download with
+    # unchanged content reuses the parsed dataframe, and the parsed data always
+    # corresponds to the bytes used in the key. Entries expire like the
+    # download itself, so old versions of the sheet do not pile up.
     fd = io.BytesIO(content)
     if sheet == "states":
-        drop_columns = [
-            "chave",
-            "Região",
-            "Estados",
-            "codigo_UF",
-            "data de referencia",
-            "taxa positividade",
-            "Link taxa de ocupação",
-        ]
         rename_columns = {
             "sigla_UF": "id",
             "População": "population",
@@ -40,20 +40,20 @@ def paho_br_dataframe(sheet) -> pd.DataFrame:
             "Casos novos ultimas 24 horas": "cases_24h",
             "Obitos ultimas 24 horas": "deaths_24h",
         }
-        df = (
-            pd.read_excel(fd, key="Estados", skipfooter=1)
-            .drop(columns=drop_columns)
-            .rename(columns=rename_columns)
-            .astype({"id": "str"})
-        )
+        df = pd.read_excel(
+            fd,
+            skipfooter=1,
+            engine="openpyxl",
+            usecols=list(rename_columns),
+            dtype={"sigla_UF": str},
+        ).rename(columns=rename_columns)
         df.index = "BR-" + df.pop("id")
 
         # Replace "Not available" in occupancy columns
-        for col in ("icu_occupancy", "hospital_occupancy"):
-            series = df[col]
-            if series.dtype != float:
-                series = series.replace({"Not available": "nan", "": "nan"}).astype(float)
-                df[col] = series
+        occupancy = ["icu_occupancy", "hospital_occupancy"]
+        df[occupancy] = (
+            df[occupancy].replace({"Not available": np.nan, "": np.nan}).astype(float)
+        )
         return df
     else:
         raise ValueError
@@ -14,8 +14,11 @@ PATH = Path(__file__).parent.parent
 def brazil_map() -> geopandas.GeoDataFrame:
     """
     Load shape files and return a GeoDataFrame with the Brazilian map.
+
+    The result shares geometry with the cached map. Callers may add columns,
+    but must not modify the geometry in-place.
     """
-    return _brazil_map().copy()
+    return _brazil_map().copy(deep=False)
 
 
 @lru_cache(1)
@@ -1,5 +1,7 @@
 import os
+from functools import lru_cache
 
+import numpy as np
 import pandas as pd
 
 from pydemic.models import Model
@@ -9,7 +11,7 @@ from .. import info
 from .. import st
 from ..components import md_description
 from ..decorators import title
-from ..i18n import _, __
+from ..i18n import _, __, current_language
 from ..utils import natural_date, get_some_attr
 
 NO_ICU_MESSAGE = __(
@@ -40,6 +42,20 @@ during the period of simulation.
 """
 )
 
+# Recommended usage of each protection equipment per patient x day, in the
+# order of the rows of healthcare_equipment_resources().
+EQUIPMENT_QUANTITIES = np.array(
+    [
+        25,  # Cirurgical masks
+        1,  # N95 mask (/ 5)
+        25,  # Waterproof apron
+        50,  # Non-sterile glove
+        1,  # Faceshield (/ 15)
+    ],
+    dtype=np.int64,
+)
+EQUIPMENT_QUANTITIES.flags.writeable = False
+
 
 def summary_cards(model: Model, where=st):
     """
@@ -219,20 +235,36 @@ def healthcare_parameters(model: Model, where=st):
         where=where,
     )
 
+    msg = _healthcare_message(
+        icu_capacity,
+        icu_surge_capacity,
+        icu_overflow_date,
+        extra_icu,
+        current_language(),
+    )
+    where.markdown(msg)
+
+
+@lru_cache(64)
+def _healthcare_message(
+    icu_capacity, icu_surge_capacity, icu_overflow_date, extra_icu, language
+):
+    """
+    Message shown by healthcare_parameters() about the ICU demand.
+    """
+
     if icu_capacity == 0:
-        msg = NO_ICU_MESSAGE.format(n=fmt(extra_icu))
+        return NO_ICU_MESSAGE.format(n=fmt(extra_icu))
     elif icu_overflow_date:
         peak_icu = extra_icu + icu_surge_capacity
-        msg = ICU_OVERFLOW_MESSAGE.format(
+        return ICU_OVERFLOW_MESSAGE.format(
             date=natural_date(icu_overflow_date),
             n=fmt(int(peak_icu - icu_surge_capacity)),
             surge=fmt(peak_icu / icu_surge_capacity),
             total=fmt(peak_icu / icu_capacity),
         )
     else:
-        msg = str(GOOD_CAPACITY_MESSAGE)
-
-    where.markdown(msg)
+        return str(GOOD_CAPACITY_MESSAGE)
 
 
 def healthcare_equipment_resources(hospital_days, icu_days):
@@ -241,22 +273,32 @@ def healthcare_equipment_resources(hospital_days, icu_days):
     from the number of hospitalization x days and ICU x days.
     """
 
+    N = int(hospital_days + icu_days)
+    df = _equipment_table(current_language()).copy()
+    df.iloc[:, 1] = EQUIPMENT_QUANTITIES * N
+    return df
+
+
+@lru_cache(8)
+def _equipment_table(language):
+    """
+    Template for healthcare_equipment_resources() with translated labels and
+    the recommended usage per patient x day. Totals are set to zero.
+    """
+
+    names = [
+        _("Cirurgical masks"),
+        _("N95 mask"),
+        _("Waterproof apron"),
+        _("Non-sterile glove"),
+        _("Faceshield"),
+    ]
     columns = [_("Quantity"), _("Total")]
     tuples = zip([_("Patients/day"), ""], columns)
 
-    N = int(hospital_days + icu_days)
-    a = 1  # / 5
-    b = 1  # / 15
     df = pd.DataFrame(
-        [
-            [_("Cirurgical masks"), 25, 25 * N],
-            [_("N95 mask"), a, a * N],
-            [_("Waterproof apron"), 25, 25 * N],
-            [_("Non-sterile glove"), 50, 50 * N],
-            [_("Faceshield"), b, b * N],
-        ]
-    ).set_index(0)
-
-    df.index.name = _("Name")
+        {0: EQUIPMENT_QUANTITIES, 1: np.zeros_like(EQUIPMENT_QUANTITIES)},
+        index=pd.Index(names, name=_("Name")),
+    )
     df.columns = pd.MultiIndex.from_tuples(tuples)
     return df
@@ -11,6 +11,7 @@ class UIProperty(UIBaseProperty):
     Property implementation for the <Model.ui> attribute.
     """
 
+    __slots__ = ()
     module = st
 
     @property
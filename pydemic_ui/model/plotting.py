@@ -1,12 +1,59 @@
+import hashlib
+from functools import lru_cache
+
 import numpy as np
 import pandas as pd
 
 from .. import st
 from ..decorators import title
-from ..i18n import _, __
+from ..i18n import _, __, current_language
+from ..st_logger import replay_cache
+
+# 5-year age groups reduced to the 10-year buckets of the mortality table:
+# 0-9, 10-19, ..., 70-79, 80+.
+AGE_GROUPS = np.arange(0, 105, 5)
+AGE_BUCKET_EDGES = np.arange(0, 18, 2)
+
+
+def _fingerprint(*values):
+    """
+    Digest of the series, arrays and scalars used as inputs of a chart.
+
+    It is combined with the current language to key the cache of chart
+    components.
+    """
+    digest = hashlib.sha1()
+    for value in values:
+        if isinstance(value, (pd.Series, pd.DataFrame)):
+            value = pd.util.hash_pandas_object(value, index=True).to_numpy()
+        data = np.ascontiguousarray(value)
+        digest.update(f"{data.dtype}{data.shape}".encode("ascii"))
+        digest.update(data.tobytes())
+    return digest.hexdigest(), current_language()
+
+
+def _hospitalizations_key(model):
+    return _fingerprint(
+        model["critical:dates"], model["severe:dates"], model["deaths:dates"]
+    )
+
+
+def _available_beds_key(model):
+    return _fingerprint(
+        model["critical:dates"],
+        model["severe:dates"],
+        model.icu_surge_capacity,
+        model.hospital_surge_capacity,
+    )
+
+
+def _deaths_key(model):
+    _labels, ifr = _mortality_ifr(model.disease)
+    return _fingerprint(model["deaths:final"], model.age_distribution, ifr)
 
 
 @title(__("Hospital demand"))
+@replay_cache(key=_hospitalizations_key)
 def hospitalizations_chart(model, where=st):
     """
     Write plot of hospitalization pressure information.
@@ -19,15 +66,17 @@ def hospitalizations_chart(model, where=st):
     where.line_chart(
         pd.DataFrame(
             {
-                _("Deaths"): deaths_ts,
-                _("Required hospital beds"): hospitalized_ts.astype(int),
-                _("Required ICU beds"): icu_ts.astype(int),
-            }
+                _("Deaths"): deaths_ts.to_numpy(),
+                _("Required hospital beds"): hospitalized_ts.to_numpy().astype(int),
+                _("Required ICU beds"): icu_ts.to_numpy().astype(int),
+            },
+            index=hospitalized_ts.index,
         )
     )
 
 
 @title(__("Available hospital beds"))
+@replay_cache(key=_available_beds_key)
 def available_beds_chart(model, where=st):
     """
     Write plot of available beds.
@@ -36,18 +85,21 @@ def available_beds_chart(model, where=st):
     icu_ts = model["critical:dates"]
     hospitalized_ts = model["severe:dates"]
 
-    available_beds_ts = model.hospital_surge_capacity - hospitalized_ts
-    available_icu_ts = model.icu_surge_capacity - icu_ts
-
-    available_beds_ts[available_beds_ts < 0] = 0
-    available_icu_ts[available_icu_ts < 0] = 0
+    available_beds = model.hospital_surge_capacity - hospitalized_ts.to_numpy()
+    available_icu = model.icu_surge_capacity - icu_ts.to_numpy()
+    np.maximum(available_beds, 0, out=available_beds)
+    np.maximum(available_icu, 0, out=available_icu)
 
     where.line_chart(
-        pd.DataFrame({_("Regular"): available_beds_ts, _("ICU"): available_icu_ts})
+        pd.DataFrame(
+            {_("Regular"): available_beds, _("ICU"): available_icu},
+            index=hospitalized_ts.index,
+        )
     )
 
 
 @title(__("Anticipated age distribution of COVID deaths by age"))
+@replay_cache(key=_deaths_key)
 def deaths_chart(model, where=st):
     """
     Age-stratified deaths.
@@ -61,22 +113,51 @@ def deaths_chart(model, where=st):
     age_distribution = model.age_distribution
     disease = model.disease
 
-    mortality = disease.mortality_table()
-    idxs = [*zip(range(0, 80, 10), range(5, 80, 10)), (80, 85, 90, 95, 100)]
-    age_distribution = np.array([age_distribution.loc[list(idx)].sum() for idx in idxs])
-
-    death_distribution = mortality["IFR"] * age_distribution
-    death_distribution = death_distribution / death_distribution.sum()
-
-    total = (death_distribution * deaths).astype(int)
-    mortality = (1e5 * mortality["IFR"]).astype(int)
+    labels, ifr = _mortality_ifr(disease)
+    ages = age_distribution.loc[AGE_GROUPS].to_numpy(dtype=float)
+    total, mortality_100k = _death_distribution(ages, ifr, deaths)
 
-    data = pd.DataFrame([total, mortality]).T
-    data.columns = ["", ""]
-    data.index = [*(f"{x}-{x + 9}" for x in data.index[:-1]), "80+"]
+    data = pd.DataFrame(
+        np.column_stack([total, mortality_100k]), index=labels, columns=["", ""]
+    )
 
     st.markdown(_("**Total cases**"))
     st.bar_chart(data.iloc[:, 0])
 
     st.markdown(_("**Mortality per 100k**"))
     st.bar_chart(data.iloc[:, 1])
+
+
+def _death_distribution(ages, ifr, deaths):
+    """
+    Distribute deaths among age buckets.
+
+    Args:
+        ages:
+            Population in each 5-year age group.
+        ifr:
+            Infection fatality ratio of each 10-year age bucket.
+        deaths:
+            Total number of deaths.
+
+    Returns:
+        A tuple of integer arrays with the number of deaths and the mortality
+        per 100k in each bucket.
+    """
+    death_distribution = np.add.reduceat(ages, AGE_BUCKET_EDGES)
+    death_distribution *= ifr
+    death_distribution *= deaths / death_distribution.sum()
+    return death_distribution.astype(int), (1e5 * ifr).astype(int)
+
+
+@lru_cache(16)
+def _mortality_ifr(disease):
+    """
+    Return the age bucket labels and the IFR of each bucket in the mortality
+    table of disease.
+    """
+    mortality = disease.mortality_table()
+    labels = (*(f"{x}-{x + 9}" for x in mortality.index[:-1]), "80+")
+    ifr = np.array(mortality["IFR"], dtype=float)
+    ifr.flags.writeable = False
+    return labels, ifr
@@ -1,7 +1,13 @@
+import io
+
+from matplotlib import pyplot as plt
+
+import mundi
 from mundi import Region
 from pydemic.region import RegionProperty, RegionT
 from pydemic.utils import fmt
 from pydemic_ui.decorators import title
+from . import info
 from . import st
 from .i18n import _, __
 
@@ -39,10 +45,13 @@ class UiProperty(RegionProperty):
         region = self.region
         st = where
 
-        curves = region.pydemic.epidemic_curve(disease, **kwargs)
-        final = curves.index[-1]
-        cases = curves.loc[final, "cases"]
-        deaths = curves.loc[final, "deaths"]
+        kwargs_items = tuple(sorted(kwargs.items()))
+        region_id = _cache_id(region)
+        if region_id is None:
+            tail = _epidemic_curve_tail(region, disease, kwargs_items)
+        else:
+            tail = _cached_epidemic_curve_tail(region_id, disease, kwargs_items)
+        final, cases, deaths = tail
 
         st.cards({_("Cases*"): fmt(cases), _("Deaths"): fmt(deaths)}, color="st-red")
         st.html(_("&ast; As measured at {date}.").format(date=final.strftime("%x")))
@@ -55,8 +64,7 @@ class UiProperty(RegionProperty):
         st = where
         region = self.region
 
-        ax = region.plot.cases_and_deaths(disease, **kwargs)
-        st.pyplot(ax.get_figure())
+        st.image(_region_plot_png(region, "cases_and_deaths", disease, kwargs))
         if download:
             data = region.pydemic.epidemic_curve()
             st.data_anchor(data, download)
@@ -73,8 +81,65 @@ class UiProperty(RegionProperty):
         if title:
             st.subheader(str(title))
 
-        ax = region.plot.weekday_rate(disease, **kwargs)
-        st.pyplot(ax.get_figure())
+        st.image(_region_plot_png(region, "weekday_rate", disease, kwargs))
+
+
+def _cache_id(region):
+    """
+    Return the id used to cache data about region, or None if region cannot be
+    recovered from the mundi database by its id (e.g., composite regions).
+    """
+    try:
+        db_region = mundi.region(region.id)
+    except (LookupError, ValueError):
+        return None
+    if type(db_region) is type(region) and db_region == region:
+        return region.id
+    return None
+
+
+@info.ttl_cache(key="ui.region")
+def _cached_epidemic_curve_tail(region_id, disease, kwargs_items):
+    return _epidemic_curve_tail(mundi.region(region_id), disease, kwargs_items)
+
+
+def _epidemic_curve_tail(region, disease, kwargs_items):
+    """
+    Return the last date and the accumulated number of cases and deaths in the
+    epidemic curve of region.
+    """
+    curves = region.pydemic.epidemic_curve(disease, **dict(kwargs_items))
+    last = curves.iloc[-1]
+    return curves.index[-1], last.at["cases"], last.at["deaths"]
+
+
+def _region_plot_png(region, kind, disease, kwargs) -> bytes:
+    """
+    Render one of the region.plot charts as PNG data, using the cache when
+    region is in the mundi database.
+    """
+    kwargs_items = tuple(sorted(kwargs.items()))
+    region_id = _cache_id(region)
+    if region_id is None:
+        return _plot_png(region, kind, disease, kwargs_items)
+    return _cached_plot_png(region_id, kind, disease, kwargs_items)
+
+
+@info.ttl_cache(key="ui.region")
+def _cached_plot_png(region_id, kind, disease, kwargs_items) -> bytes:
+    return _plot_png(mundi.region(region_id), kind, disease, kwargs_items)
+
+
+def _plot_png(region, kind, disease, kwargs_items) -> bytes:
+    """
+    Render one of the region.plot charts as PNG data.
+    """
+    ax = getattr(region.plot, kind)(disease, **dict(kwargs_items))
+    fig = ax.get_figure()
+    fd = io.BytesIO()
+    fig.savefig(fd, format="png", bbox_inches="tight")
+    plt.close(fig)
+    return fd.getvalue()
 
 
 def patch_region():
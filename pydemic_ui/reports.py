@@ -1,16 +1,35 @@
+import inspect
 import io
+import os
 import pathlib
+import re
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from typing import BinaryIO
 
-from weasyprint import HTML
+from weasyprint import HTML, CSS
 
 from . import jinja
 
 PATH = pathlib.Path(__file__).parent
 ASSETS = PATH / "assets"
+REPORT_CSS = CSS(filename=str(ASSETS / "report.css"))
 
+# Skip stream compression and font subsetting: faster renders, larger files
+FAST_PDF_OPTIONS = {"optimize_size": (), "uncompressed_pdf": True}
 
-def pdf_from_html(data, to=None) -> BinaryIO:
+# Screen-only stylesheets, marked as <link data-pdf-skip ...> in templates
+PDF_SKIP_LINK = re.compile(r"<link[^>]+data-pdf-skip[^>]*>")
+
+# Shared pool for rendering PDFs in the background
+_PDF_POOL = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="pdf")
+
+# Playwright sync objects only work in the thread that created them, hence a
+# single thread owns the Chromium browser and runs all of its renders.
+_CHROMIUM_THREAD = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chromium")
+
+
+def pdf_from_html(data, to=None, compact=False) -> BinaryIO:
     """
     Render a PDF file from an HTML string.
         data:
@@ -18,21 +37,38 @@ def pdf_from_html(data, to=None) -> BinaryIO:
         to:
             Destination file. If not given, return a BytesIO object with the
             PDF contents.
+        compact:
+            If True, compress and optimize the resulting PDF. This produces
+            smaller files, but is considerably slower.
+
+    Link elements marked with a data-pdf-skip attribute are removed before
+    rendering, so WeasyPrint does not fetch and parse screen-only stylesheets.
+
+    The rendering backend is controlled by the PYDEMIC_UI_PDF_BACKEND
+    environment variable. It can be either "weasyprint" (default) or
+    "chromium", which uses a persistent headless browser controlled by
+    Playwright. Chromium is much faster for large documents, but must be
+    installed separately and ignores the compact flag. The browser lives in a
+    dedicated thread and renders one document at a time, hence the *_async
+    functions refuse to use it.
 
     Returns:
         A file descriptor object with the resulting pdf data.
     """
 
     fd = to or io.BytesIO()
-    report = HTML(string=data)
-    report.write_pdf(fd, stylesheets=[ASSETS / "report.css"])
+    data = _strip_screen_only(data)
+    backend = _pdf_backend()
+    if backend == "weasyprint":
+        _write_pdf(HTML(string=data), fd, compact, stylesheets=[REPORT_CSS])
+    elif backend == "chromium":
+        _write_pdf_chromium(data, fd)
+    else:
+        raise ValueError(f"invalid PDF backend: {backend!r}")
+    return _result(fd)
 
-    if isinstance(fd, str):
-        return open(fd, "rb")
-    return io.BytesIO(fd.getvalue())
 
-
-def pdf_from_template(template, ctx, to=None) -> BinaryIO:
+def pdf_from_template(template, ctx, to=None, compact=False) -> BinaryIO:
     """
     Render a PDF from an HTML template file in the given context.
 
@@ -44,10 +80,140 @@ def pdf_from_template(template, ctx, to=None) -> BinaryIO:
         to:
             Destination file. If not given, return a BytesIO object with the
             PDF contents.
+        compact:
+            If True, compress and optimize the resulting PDF.
 
     Returns:
         A file descriptor object with the resulting pdf data.
     """
     template = jinja.env.get_template(template + ".jinja2")
     html = template.render(ctx)
-    return pdf_from_html(html, to=to)
+    return pdf_from_html(html, to=to, compact=compact)
+
+
+def pdf_from_templates(pairs, to=None, compact=False) -> BinaryIO:
+    """
+    Render several templates into a single PDF.
+
+    This is faster than calling :func:`pdf_from_template` for each template,
+    since the whole batch is written as a single document. Pages are merged
+    by WeasyPrint, hence this function ignores PYDEMIC_UI_PDF_BACKEND and
+    always uses the WeasyPrint backend.
+
+    Args:
+        pairs:
+            A sequence of (template, ctx) pairs.
+        to:
+            Destination file. If not given, return a BytesIO object with the
+            PDF contents.
+        compact:
+            If True, compress and optimize the resulting PDF.
+
+    Returns:
+        A file descriptor object with the resulting pdf data.
+    """
+    documents = []
+    for template, ctx in pairs:
+        html = jinja.env.get_template(template + ".jinja2").render(ctx)
+        report = HTML(string=_strip_screen_only(html))
+        documents.append(report.render(stylesheets=[REPORT_CSS]))
+    if not documents:
+        raise ValueError("no templates to render")
+
+    pages = [page for document in documents for page in document.pages]
+    fd = to or io.BytesIO()
+    _write_pdf(documents[0].copy(pages), fd, compact)
+    return _result(fd)
+
+
+def pdf_from_html_async(data, to=None, compact=False) -> "Future[BinaryIO]":
+    """
+    Like :func:`pdf_from_html`, but renders PDF in a background thread.
+
+    It is not available for the "chromium" backend.
+
+    Returns:
+        A future that resolves to the file descriptor with the resulting pdf
+        data.
+    """
+    _check_async_backend()
+    return _PDF_POOL.submit(pdf_from_html, data, to=to, compact=compact)
+
+
+def pdf_from_template_async(template, ctx, to=None, compact=False) -> "Future[BinaryIO]":
+    """
+    Like :func:`pdf_from_template`, but renders PDF in a background thread.
+
+    It is not available for the "chromium" backend.
+
+    Returns:
+        A future that resolves to the file descriptor with the resulting pdf
+        data.
+    """
+    _check_async_backend()
+    return _PDF_POOL.submit(pdf_from_template, template, ctx, to=to, compact=compact)
+
+
+def _pdf_backend() -> str:
+    return os.environ.get("PYDEMIC_UI_PDF_BACKEND", "weasyprint").lower()
+
+
+def _check_async_backend():
+    if _pdf_backend() == "chromium":
+        raise ValueError("the chromium PDF backend does not support async rendering")
+
+
+def _strip_screen_only(html: str) -> str:
+    if "data-pdf-skip" in html:
+        return PDF_SKIP_LINK.sub("", html)
+    return html
+
+
+def _write_pdf(report, fd, compact, **kwargs):
+    options = {} if compact else _fast_pdf_options(type(report))
+    report.write_pdf(fd, **kwargs, **options)
+
+
+@lru_cache(4)
+def _fast_pdf_options(cls) -> dict:
+    # Older versions of WeasyPrint do not accept all FAST_PDF_OPTIONS
+    params = inspect.signature(cls.write_pdf).parameters
+    if any(p.kind is p.VAR_KEYWORD for p in params.values()):
+        return FAST_PDF_OPTIONS
+    return {k: v for k, v in FAST_PDF_OPTIONS.items() if k in params}
+
+
+def _write_pdf_chromium(data, fd):
+    pdf = _CHROMIUM_THREAD.submit(_render_chromium, data).result()
+    if isinstance(fd, str):
+        with open(fd, "wb") as out:
+            out.write(pdf)
+    else:
+        fd.write(pdf)
+
+
+def _render_chromium(data) -> bytes:
+    # Must only run in the _CHROMIUM_THREAD executor
+    page = _chromium().new_page()
+    try:
+        page.set_content(data)
+        page.add_style_tag(path=str(ASSETS / "report.css"))
+        return page.pdf(print_background=True)
+    finally:
+        page.close()
+
+
+@lru_cache(1)
+def _chromium():
+    # Launching a browser is expensive, hence we keep a single instance alive
+    # in the thread of the _CHROMIUM_THREAD executor.
+    from playwright.sync_api import sync_playwright
+
+    return sync_playwright().start().chromium.launch()
+
+
+def _result(fd) -> BinaryIO:
+    if isinstance(fd, str):
+        return open(fd, "rb")
+    fd.seek(0)
+    return fd
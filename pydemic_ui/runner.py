@@ -1,18 +1,23 @@
 import importlib
+import logging
 
+import sidekick.api as sk
 import streamlit as st
 
 from pydemic.logging import log
 from pydemic.utils import to_json
 from .i18n import _
 
+# Maps qualified names of runner factories to runner functions
+_RUNNER_FUNCTIONS = {}
+
 
 class Runner:
     """
     Wraps a function to gain a to_json() method and being pickable.
     """
 
-    @property
+    @sk.lazy
     def name(self):
         return f"{self.func.__module__}.{self.func.__qualname__}"
 
@@ -22,13 +27,18 @@ class Runner:
         self.kwargs = kwargs
 
     def __call__(self, model, days):
-        log.info("Runner: %s" % self)
+        if log.isEnabledFor(logging.INFO):
+            log.info("Runner: %s", self)
         return self.func(*self.args, **self.kwargs)(model, days)
 
     def __repr__(self):
         return f"<Runner object for {self}>"
 
     def __str__(self):
+        return self._str
+
+    @sk.lazy
+    def _str(self):
         args = [*map(repr, self.args)]
         args.extend(f"{k}={v!r}" for k, v in self.kwargs.items())
         args = ", ".join(args)
@@ -38,11 +48,18 @@ class Runner:
         return self.name, self.args, self.kwargs
 
     def __setstate__(self, state):
+        for attr in ("name", "_str", "_json"):
+            self.__dict__.pop(attr, None)
         name, self.args, self.kwargs = state
-        mod_name, _, func_name = name.rpartition(".")
-        mod = importlib.import_module(mod_name)
-        factory = getattr(mod, func_name)
-        self.func = getattr(factory, "runner_function", factory)
+        try:
+            self.func = _RUNNER_FUNCTIONS[name]
+        except KeyError:
+            mod_name, _, func_name = name.rpartition(".")
+            mod = importlib.import_module(mod_name)
+            factory = getattr(mod, func_name)
+            self.func = _RUNNER_FUNCTIONS[name] = getattr(
+                factory, "runner_function", factory
+            )
 
     def __eq__(self, other):
         if isinstance(other, Runner):
@@ -50,6 +67,10 @@ class Runner:
         return NotImplemented
 
     def to_json(self):
+        return dict(self._json)
+
+    @sk.lazy
+    def _json(self):
         return {
             "runner": self.name,
             "args": to_json(self.args),
@@ -100,7 +121,10 @@ def stage_runner(stages):
 
             duration = min(dt, days)
             if duration:
-                log.debug(f"stage_runner: Running {duration} steps with R0={model.R0}")
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug(
+                        "stage_runner: Running %d steps with R0=%s", duration, model.R0
+                    )
                 model.run(duration)
 
             days -= dt
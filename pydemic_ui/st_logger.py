@@ -1,12 +1,13 @@
 from collections import deque
 from functools import wraps, lru_cache
 from types import MappingProxyType
-from typing import NamedTuple
 
 from pydemic.utils import format_args
 
 
 class Mixin:
+    __slots__ = ()
+    _fields = ()
     result: object
     name: str
     args: tuple
@@ -15,6 +16,20 @@ class Mixin:
     def __str__(self):
         return f"driver.{self.name}({self._repr_args()})"
 
+    def __eq__(self, other):
+        if type(self) is type(other):
+            return all(getattr(self, k) == getattr(other, k) for k in self._fields)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __getstate__(self):
+        return tuple(getattr(self, k) for k in self._fields)
+
+    def __setstate__(self, state):
+        for k, v in zip(self._fields, state):
+            setattr(self, k, v)
+
     def _repr_args(self):
         if self.args is ... and self.kwargs is ...:
             return "..."
@@ -25,32 +40,27 @@ class Mixin:
         """
         Check if given args and kwargs are expected
         """
-        if self.args is not ... and (args != self.args or kwargs != self.kwargs):
-            args = format_args(*args, **kwargs)
-            msg = f"called with wrong arguments, expect {self}, got: {self.name}({args})"
-            raise AssertionError(msg)
-        return self.result
-
-
-class _Step(NamedTuple):
-    name: str
-    args: tuple = ()
-    kwargs: dict = MappingProxyType({})
-    result = None
-
+        if self.args is ... or (args == self.args and kwargs == self.kwargs):
+            return self.result
 
-class _Expect(NamedTuple):
-    result: object
-    name: str
-    args: tuple = None
-    kwargs: dict = None
+        args = format_args(*args, **kwargs)
+        msg = f"called with wrong arguments, expect {self}, got: {self.name}({args})"
+        raise AssertionError(msg)
 
 
-class Step(Mixin, _Step):
+class Step(Mixin):
     """
     Execution step of a streamlit command.
     """
 
+    __slots__ = _fields = ("name", "args", "kwargs")
+    result = None
+
+    def __init__(self, name, args=(), kwargs=MappingProxyType({})):
+        self.name = name
+        self.args = args
+        self.kwargs = kwargs
+
     @staticmethod
     def from_call(*args, **kwargs):
         """
@@ -70,11 +80,22 @@ class Step(Mixin, _Step):
         return fn(*self.args, **self.kwargs)
 
 
-class Expect(Mixin, _Expect):
+class Expect(Mixin):
     """
     Input step.
     """
 
+    __slots__ = _fields = ("result", "name", "args", "kwargs")
+
+    def __init__(self, result, name, args=None, kwargs=None):
+        self.result = result
+        self.name = name
+        self.args = args
+        self.kwargs = kwargs
+
+    def __repr__(self):
+        return f"ask.{self.name}[{self.result!r}]({self._repr_args()})"
+
     def check(self, step: Step):
         if self.name != step.name:
             raise AssertionError("executed the wrong function.")
@@ -90,13 +111,13 @@ class StLogger:
     """
 
     def __init__(self):
-        self._steps = []
+        self._steps = deque()
 
     def __getstate__(self):
-        return self._steps[:]
+        return list(self._steps)
 
     def __setstate__(self, state):
-        self._steps = state[:]
+        self._steps = deque(state)
 
     def __getattr__(self, attr):
         if attr.startswith("_"):
@@ -132,12 +153,23 @@ class Replay(StLogger):
     A simple logger used to cache streamlit executions and replay them.
     """
 
+    # Target, number of steps and resolved (method, args, kwargs) triples of the
+    # last replay.
+    _resolved = None
+
     def __init__(self, module):
         super().__init__()
         self._module = module
 
     def __call__(self, st=None):
-        return super()(st or self._module)
+        st = st or self._module
+        resolved = self._resolved
+        if resolved is None or resolved[0] is not st or resolved[1] != len(self._steps):
+            steps = [(getattr(st, s.name), s.args, s.kwargs) for s in self._steps]
+            resolved = self._resolved = (st, len(steps), steps)
+
+        for fn, args, kwargs in resolved[2]:
+            fn(*args, **kwargs)
 
     def pyplot(self, *args, **kwargs):
         if not args:
@@ -155,26 +187,43 @@ class Driver(StLogger):
     Streamlit test driver.
     """
 
-    _tasks: deque
+    _steps: list
+    _cursor: int
 
     def __init__(self, expect=()):
         super().__init__()
-        self._steps = deque(self._steps)
+        self._steps = []
+        self._cursor = 0
 
         for task in expect:
             self.expect(task)
 
+    def __getstate__(self):
+        return self._steps[self._cursor :]
+
+    def __setstate__(self, state):
+        self._steps = list(state)
+        self._cursor = 0
+
+    def __iter__(self):
+        """
+        Return list of pending steps
+        """
+        return iter(self._steps[self._cursor :])
+
     def __getattr__(self, attr):
         if attr.startswith("_"):
             raise AttributeError(attr)
 
         def method(*args, **kwargs):
-            if not self._steps:
+            idx = self._cursor
+            if idx >= len(self._steps):
                 args = format_args(*args, **kwargs)
                 msg = f"Trying to execute st.{attr}({args}), but task queue is empty"
                 raise AssertionError(msg)
 
-            task = self._steps.popleft()
+            task = self._steps[idx]
+            self._cursor = idx + 1
             if task is ...:
                 return
 
@@ -185,6 +234,7 @@ class Driver(StLogger):
 
             return task.assert_arguments(args, kwargs)
 
+        setattr(self, attr, method)
         return method
 
     def expect(self, task):
@@ -207,30 +257,70 @@ class Driver(StLogger):
         Return True if the queue of tasks is empty.
         """
 
-        return not self._steps
+        return self._cursor >= len(self._steps)
 
 
-def replay_cache(func):
+def replay_cache(func=None, *, key=None):
     """
     Decorate function that receives a where=st keyword argument.
+
+    The output is recorded in a :class:`Replay` object that is cached and
+    replayed into the given target on subsequent calls. The optional key
+    function receives the same arguments as func and returns a hashable
+    fingerprint used instead of the arguments to index the cache. In that
+    case, cache entries do not keep references to the arguments.
     """
 
+    if func is None:
+        return lambda fn: replay_cache(fn, key=key)
+
     from pydemic_ui import st
 
     @lru_cache(50)
-    def output_replay(*args, **kwargs) -> Replay:
+    def output_replay(call) -> Replay:
         replay = Replay(st)
-        func(*args, st=replay, **kwargs)
+        func(*call.args, where=replay, **call.kwargs)
+        if key is not None:
+            call.args = call.kwargs = None
         return replay
 
     @wraps(func)
     def cached(*args, where=None, **kwargs):
-        replay = output_replay(*args, **kwargs)
+        replay = output_replay(_Call(key, args, kwargs))
         return replay(where)
 
+    cached.cache_info = output_replay.cache_info
+    cached.cache_clear = output_replay.cache_clear
     return cached
 
 
+class _Call:
+    """
+    Arguments of a cached call, hashed and compared by their fingerprint.
+
+    Arguments are only needed to compute a cache miss and are released
+    afterwards when the fingerprint is given by a key function.
+    """
+
+    __slots__ = ("args", "kwargs", "fingerprint")
+
+    def __init__(self, key, args, kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        if key is None:
+            self.fingerprint = (args, frozenset(kwargs.items()))
+        else:
+            self.fingerprint = key(*args, **kwargs)
+
+    def __hash__(self):
+        return hash(self.fingerprint)
+
+    def __eq__(self, other):
+        if isinstance(other, _Call):
+            return self.fingerprint == other.fingerprint
+        return NotImplemented
+
+
 class _Out:
     """
     Implements the out singleton.
@@ -243,6 +333,7 @@ class _Out:
             return Step(attr, args, kwargs)
 
         method.__name__ = attr
+        setattr(self, attr, method)
         return method
 
 
@@ -252,7 +343,9 @@ class _Ask:
     """
 
     def __getattr__(self, attr):
-        return _AskInput(attr)
+        value = _AskInput(attr)
+        setattr(self, attr, value)
+        return value
 
 
 class _AskInput:
@@ -287,6 +380,8 @@ def with_title(fn, default=None, level="header", where=None):
     def decorated(
         *args, title=NOT_GIVEN, header=NOT_GIVEN, subheader=NOT_GIVEN, **kwargs
     ):
+        if title is header is subheader is NOT_GIVEN and not default:
+            return fn(*args, **kwargs)
 
         st = kwargs.get("where", st_mod) if where is None else where
 
@@ -1,5 +1,7 @@
 __package__ = "pydemic_ui.ui"
 
+from functools import lru_cache
+
 import numpy as np
 import pandas as pd
 import streamlit as st
@@ -37,19 +39,7 @@ def population_info_chart(age_pyramid, where=st):
     pause(where=st)
     st.subheader(_("Population pyramid") + "*")
 
-    # Reindex age_pyramid to 10yrs groups
-    ages = list(map(list, zip(age_pyramid.index[:-3:2], age_pyramid.index[1::2])))
-    ages[-1] = [80, 85, 90, 95, 100]
-    rows = []
-    for r in ages:
-        rows.append(age_pyramid.loc[r].sum())
-    data = pd.DataFrame(rows, index=age_pyramid.index[:-3:2])
-
-    # Change index to show ranges
-    ends = [*(f"-{n}" for n in (np.array(data.index) - 1)[1:]), "+"]
-    age_ranges = [f"{a}{b}" for a, b, in zip(data.index, ends)]
-    data.index = age_ranges
-
+    data = _decade_pyramid(age_pyramid)
     data = data.rename({"female": "left", "male": "right"}, axis=1)
     pyramid_chart(data, _("Female"), _("Male"), where=st)
 
@@ -64,3 +54,26 @@ com estimadores bayesianos, Brasil 2010 - 2030, 2019
         f'<div style="font-size: smaller; text-align: right;">* '
         f"<strong>{label}</strong>:{source}</div>"
     )
+
+
+def _decade_pyramid(age_pyramid):
+    """
+    Reindex a pyramid of 5yrs age groups to 10yrs groups labeled by their
+    age ranges. The last group (80+) extends to the end of the pyramid.
+    """
+    starts = np.arange(0, len(age_pyramid) - 3, 2)
+    return pd.DataFrame(
+        np.add.reduceat(age_pyramid.to_numpy(), starts, axis=0),
+        index=_age_range_labels(tuple(age_pyramid.index[starts])),
+        columns=age_pyramid.columns,
+    )
+
+
+@lru_cache(8)
+def _age_range_labels(index):
+    """
+    Labels for the age groups starting at each value of index, e.g.,
+    (0, 10, 20) -> ("0-9", "10-19", "20+").
+    """
+    ends = [*(f"-{n - 1}" for n in index[1:]), "+"]
+    return tuple(f"{a}{b}" for a, b in zip(index, ends))
@@ -1,40 +1,42 @@
-from functools import singledispatch
+from functools import lru_cache
+from operator import attrgetter
 
 import pandas as pd
-from babel.dates import format_date
+from babel import default_locale
 from pandas.io.formats.style import Styler
 
-from pydemic_ui.i18n import _
+from pydemic_ui.i18n import _, current_language
 
 NOT_GIVEN = object()
 
+# Template for data_to_dataframe(None). Callers receive copies.
+EMPTY_DATAFRAME = pd.DataFrame(columns=["data"])
+
 
-@singledispatch
 def data_to_dataframe(data) -> pd.DataFrame:
     """
     Coerce input to a pandas DataFrame.
     """
-    return pd.DataFrame(data)
-
-
-@data_to_dataframe.register(pd.DataFrame)
-def _(data):
-    return data
-
-
-@data_to_dataframe.register(pd.Series)
-def _(data):
-    return pd.DataFrame({"data": data})
-
-
-@data_to_dataframe.register(Styler)
-def _(data):
-    return data_to_dataframe(data.data)
-
-
-@data_to_dataframe.register(type(None))
-def _(_data):
-    return pd.DataFrame([[]], columns=["data"])
+    cls = type(data)
+    try:
+        converter = _DATAFRAME_CONVERTERS[cls]
+    except KeyError:
+        converter = next(
+            (_DATAFRAME_CONVERTERS[k] for k in cls.__mro__ if k in _DATAFRAME_CONVERTERS),
+            pd.DataFrame,
+        )
+        _DATAFRAME_CONVERTERS[cls] = converter
+    return converter(data)
+
+
+# Maps types to functions that convert their instances to DataFrames. Entries
+# for subclasses are added as they are seen.
+_DATAFRAME_CONVERTERS = {
+    pd.DataFrame: lambda data: data,
+    pd.Series: lambda data: data.to_frame(name="data"),
+    Styler: lambda data: data_to_dataframe(data.data),
+    type(None): lambda _data: EMPTY_DATAFRAME.copy(),
+}
 
 
 def natural_date(x):
@@ -48,7 +50,36 @@ def natural_date(x):
     elif x is None:
         return _("Not soon...")
     else:
-        return format_date(x, format="short")
+        return _short_date(x, _date_locale())
+
+
+def _date_locale():
+    """
+    Locale used to format dates: the language set by set_i18n, or the LC_TIME
+    locale of the system.
+    """
+    language = current_language()
+    if language:
+        return language.split(":")[0]
+    return default_locale("LC_TIME") or "en_US"
+
+
+@lru_cache(1024)
+def _short_date(date, locale):
+    """
+    Short representation of date in the given locale.
+    """
+    return _short_date_pattern(locale).apply(date, locale)
+
+
+@lru_cache(32)
+def _short_date_pattern(locale):
+    """
+    Compiled short date pattern for the given locale.
+    """
+    from babel.dates import get_date_format, parse_pattern
+
+    return parse_pattern(get_date_format("short", locale=locale))
 
 
 def get_some_attr(obj, *attrs, default=NOT_GIVEN):
@@ -59,22 +90,17 @@ def get_some_attr(obj, *attrs, default=NOT_GIVEN):
     """
 
     for attr in attrs:
-        if "." in attr:
-            tmp = obj
-
-            for part in attr.split("."):
-                try:
-                    tmp = getattr(tmp, part)
-                except AttributeError:
-                    break
-            else:
-                return tmp
-        else:
-            try:
-                return getattr(obj, attr)
-            except AttributeError:
-                continue
+        try:
+            return _attrgetter(attr)(obj)
+        except AttributeError:
+            continue
 
     if default is NOT_GIVEN:
         raise AttributeError
     return default
+
+
+@lru_cache(256)
+def _attrgetter(attr):
+    """Cached operator.attrgetter for the given (possibly dotted) name."""
+    return attrgetter(attr)
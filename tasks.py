@@ -1,4 +1,5 @@
 import os
+import shlex
 import sys
 
 import click
@@ -92,8 +93,9 @@ def publish(ctx):
 @task
 def clear_cache(ctx, all=False):
     extra = ("pydemic",) if all else ()
-    for dir in ("ui", "ui.info", "ui.app.calc", *extra):
-        ctx.run(f"rm ~/.local/pydemic/cache/{dir} -rfv")
+    cache = os.path.expanduser("~/.local/pydemic/cache")
+    dirs = (os.path.join(cache, d) for d in ("ui", "ui.info", "ui.app.calc", *extra))
+    ctx.run("rm -rfv " + " ".join(map(shlex.quote, dirs)))
 
 
 @task
@@ -1 +1,50 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pydemic.diseases import covid19
 from pydemic.testing import en
+
+
+class FakeModel:
+    """
+    Minimal stand-in for a clinical model.
+
+    It exposes the results used by charts and records the R0 used in each
+    call to run().
+    """
+
+    disease = covid19
+    icu_surge_capacity = 100
+    hospital_surge_capacity = 1000
+
+    def __init__(self, start="2020-01-01", R0=2.0, severe=10.0, critical=2.0, deaths=1.0):
+        self.start = pd.to_datetime(start)
+        self.R0 = R0
+        self.history = []
+
+        dates = pd.date_range(self.start, periods=30)
+        self.results = {
+            "severe:dates": pd.Series(np.linspace(0, severe, 30), index=dates),
+            "critical:dates": pd.Series(np.linspace(0, critical, 30), index=dates),
+            "deaths:dates": pd.Series(np.linspace(0, deaths, 30), index=dates),
+            "deaths:final": deaths,
+        }
+        self.age_distribution = pd.Series(1000.0, index=np.arange(0, 105, 5))
+
+    def __getitem__(self, key):
+        return self.results[key]
+
+    def to_date(self, time):
+        return self.start + pd.Timedelta(days=time)
+
+    def run(self, days):
+        self.history.append((days, self.R0))
+
+
+@pytest.fixture
+def fake_model():
+    """
+    Factory of FakeModel instances.
+    """
+    return FakeModel
@@ -0,0 +1,74 @@
+import pandas as pd
+
+from pydemic_ui.lib import data_sections
+from pydemic_ui.lib.data_columns import Column
+
+
+class TestSection:
+    def test_formatted_data(self):
+        section = data_sections.Section(
+            "test",
+            "Test",
+            (
+                Column("ratio", "Ratio", fmt="{:.1f}%"),
+                Column("name", "Name", fmt=None),
+                Column("count", "Count", fmt=lambda x: f"<{x:n}>"),
+            ),
+        )
+        data = pd.DataFrame(
+            {
+                "count": [1, None],
+                "ratio": [12.34, None],
+                "name": ["a", "b"],
+                "other": [1, 2],
+            },
+            index=["BR-1", "BR-2"],
+        )
+        formatted = section.formatted_data(data)
+        assert list(formatted.columns) == ["ratio", "name", "count"]
+        assert formatted.to_dict("index") == {
+            "BR-1": {"ratio": "12.3%", "name": "a", "count": "<1>"},
+            "BR-2": {"ratio": "-", "name": "b", "count": "-"},
+        }
+
+
+class TestExtremaStyles:
+    def test_cache_key_includes_columns(self):
+        a = pd.DataFrame({"x": [1.0, 2.0], "y": [3.0, 4.0]})
+        b = pd.DataFrame({"u": [1.0, 2.0], "v": [3.0, 4.0]})
+        assert data_sections._hash_dataframe(a) != data_sections._hash_dataframe(b)
+
+        styles_a = data_sections._extrema_styles(a)
+        styles_b = data_sections._extrema_styles(b)
+        assert list(styles_a.columns) == ["x", "y"]
+        assert list(styles_b.columns) == ["u", "v"]
+        assert b.style.apply(data_sections._extrema_styles, axis=None)._compute().ctx
+
+
+class TestHighlightExtrema:
+    def test_same_styles_as_highlight_max_and_min(self):
+        data = pd.DataFrame(
+            {
+                "nan": [1.0, None, 3.0, 2.0],
+                "tied": [5, 5, 1, 1],
+                "constant": [7, 7, 7, 7],
+                "flag": [True, False, True, False],
+                "name": ["a", "b", "c", "d"],
+            }
+        )
+        numeric = ["nan", "tied", "constant"]
+        old = (
+            data.style.highlight_max(subset=numeric, color="red")
+            .highlight_min(subset=numeric, color="green")
+            ._compute()
+        )
+        new = data.style.apply(data_sections._highlight_extrema, axis=None)._compute()
+        assert _css(new.ctx) == _css(old.ctx)
+
+
+def _css(ctx):
+    """
+    Non-empty CSS declarations of each styled cell.
+    """
+    css = {k: [x for x in v if x] for k, v in ctx.items()}
+    return {k: v for k, v in css.items() if v}
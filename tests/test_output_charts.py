@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+
+from pydemic_ui.ui import output_charts
+
+
+def age_pyramid():
+    ages = np.arange(0, 105, 5)
+    return pd.DataFrame(
+        {"female": 10.0 * np.arange(1, 22), "male": np.arange(1, 22) ** 2.0},
+        index=ages,
+    )
+
+
+class TestPopulationPyramid:
+    def test_decade_pyramid_matches_row_sums(self):
+        pyramid = age_pyramid()
+
+        # Previous implementation, summing rows of each group with .loc
+        ages = list(map(list, zip(pyramid.index[:-3:2], pyramid.index[1::2])))
+        ages[-1] = [80, 85, 90, 95, 100]
+        expected = pd.DataFrame(
+            [pyramid.loc[r].sum() for r in ages], index=pyramid.index[:-3:2]
+        )
+
+        data = output_charts._decade_pyramid(pyramid)
+        assert list(data.columns) == ["female", "male"]
+        assert data.to_numpy().tolist() == expected.to_numpy().tolist()
+        # 80+ sums the 80 to 100 groups: 17 + 18 + 19 + 20 + 21 = 95
+        assert data.loc["80+"].tolist() == [950.0, 1815.0]
+
+    def test_age_range_labels(self):
+        index = tuple(range(0, 90, 10))
+        assert output_charts._age_range_labels(index) == (
+            *("0-9", "10-19", "20-29", "30-39", "40-49", "50-59", "60-69", "70-79"),
+            "80+",
+        )
+        assert output_charts._age_range_labels((0, 5)) == ("0-4", "5+")
+
+        data = output_charts._decade_pyramid(age_pyramid())
+        assert list(data.index) == list(output_charts._age_range_labels(index))
@@ -0,0 +1,81 @@
+import gc
+import weakref
+
+import numpy as np
+import pandas as pd
+
+from pydemic_ui.model import plotting
+from pydemic_ui.st_logger import Driver, out, replay_cache
+
+
+class TestChartCache:
+    def test_chart_keys_depend_only_on_chart_inputs(self, fake_model):
+        keys = [
+            plotting._hospitalizations_key,
+            plotting._available_beds_key,
+            plotting._deaths_key,
+        ]
+        for key in keys:
+            assert key(fake_model()) == key(fake_model())
+            changed = fake_model(severe=20.0, critical=4.0, deaths=2.0)
+            assert key(fake_model()) != key(changed)
+
+        m1, m2 = fake_model(), fake_model()
+        m2.icu_surge_capacity = 50
+        assert plotting._available_beds_key(m1) != plotting._available_beds_key(m2)
+        assert plotting._hospitalizations_key(m1) == plotting._hospitalizations_key(m2)
+
+        m2.age_distribution = m2.age_distribution * 2
+        assert plotting._deaths_key(m1) != plotting._deaths_key(m2)
+
+    def test_replay_cache_with_key_does_not_keep_arguments(self, fake_model):
+        calls = []
+
+        @replay_cache(key=lambda model: model["deaths:final"])
+        def chart(model, where=None):
+            calls.append(model)
+            where.write(model["deaths:final"])
+
+        model = fake_model()
+        ref = weakref.ref(model)
+        chart(model, where=Driver([out.write(1.0)]))
+        chart(fake_model(), where=Driver([out.write(1.0)]))
+        assert len(calls) == 1
+        assert chart.cache_info().hits == 1
+
+        del model
+        calls.clear()
+        gc.collect()
+        assert ref() is None
+
+
+class Disease:
+    """
+    Disease with a simple mortality table.
+    """
+
+    def mortality_table(self):
+        ifr = [0, 0.0001, 0.0002, 0.0005, 0.001, 0.002, 0.005, 0.01, 0.02]
+        return pd.DataFrame({"IFR": ifr}, index=range(0, 90, 10))
+
+
+class TestDeathsChart:
+    def test_death_distribution(self):
+        labels, ifr = plotting._mortality_ifr(Disease())
+        assert labels == (
+            *("0-9", "10-19", "20-29", "30-39", "40-49", "50-59", "60-69", "70-79"),
+            "80+",
+        )
+
+        # Groups 80 to 100 all fall in the open-ended 80+ bucket:
+        # 17 + 18 + 19 + 20 + 21 = 95.
+        ages = 1000.0 * np.arange(1, 22)
+        total, mortality_100k = plotting._death_distribution(ages, ifr, 24204)
+        assert list(total) == [0, 7, 22, 75, 190, 460, 1350, 3100, 19000]
+        assert list(mortality_100k) == [0, 10, 20, 50, 100, 200, 500, 1000, 2000]
+
+        # In-place operations must not touch the inputs or the cached IFR
+        assert list(ages) == list(1000.0 * np.arange(1, 22))
+        assert not ifr.flags.writeable
+        again, _ = plotting._death_distribution(ages, ifr, 24204)
+        assert list(again) == list(total)
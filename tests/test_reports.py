@@ -0,0 +1,39 @@
+import io
+
+from pydemic_ui import reports
+
+
+class OldDocument:
+    """
+    Older write_pdf signature, without uncompressed_pdf.
+    """
+
+    def write_pdf(self, target=None, zoom=1, attachments=None, optimize_size=("fonts",)):
+        self.options = {"optimize_size": optimize_size}
+
+
+class NewDocument:
+    """
+    Newer write_pdf signature, which accepts options by keyword.
+    """
+
+    def write_pdf(self, target=None, zoom=1, finisher=None, **options):
+        self.options = options
+
+
+class TestFastPdfOptions:
+    def test_options_supported_by_old_signature(self):
+        assert reports._fast_pdf_options(OldDocument) == {"optimize_size": ()}
+
+    def test_options_supported_by_new_signature(self):
+        assert reports._fast_pdf_options(NewDocument) == reports.FAST_PDF_OPTIONS
+
+    def test_write_pdf_uses_options_unless_compact(self):
+        for cls in (OldDocument, NewDocument):
+            fast = cls()
+            reports._write_pdf(fast, io.BytesIO(), compact=False)
+            assert fast.options == reports._fast_pdf_options(cls)
+
+        compact = NewDocument()
+        reports._write_pdf(compact, io.BytesIO(), compact=True)
+        assert compact.options == {}
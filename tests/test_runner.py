@@ -1,4 +1,5 @@
 import pickle
+from unittest.mock import Mock
 
 import pandas as pd
 
@@ -15,3 +16,27 @@ class TestRunner:
         for r in [r1, r2, r3]:
             dump = pickle.dumps(r)
             assert pickle.loads(dump) == r
+
+    def test_R0_rate_runner_changes_R0_at_the_given_date(self, fake_model):
+        model = fake_model("2020-01-01", R0=2.0)
+        runner.R0_rate_runner(pd.to_datetime("2020-01-11"), 0.5)(model, 30)
+        assert model.history == [(10, 2.0), (20, 1.0)]
+
+    def test_R0_rate_runner_before_simulation_start(self, fake_model, monkeypatch):
+        st = Mock()
+        monkeypatch.setattr(runner, "st", st)
+        model = fake_model("2020-01-11", R0=2.0)
+        runner.R0_rate_runner(pd.to_datetime("2020-01-01"), 0.5)(model, 30)
+        assert model.history == [(30, 1.0)]
+        st.warning.assert_called_once()
+
+    def test_cached_representations(self):
+        date = pd.to_datetime("2020-01-01")
+        r = runner.R0_rate_runner(date, 0.5)
+        assert str(r) == f"pydemic_ui.runner.R0_rate_runner({date!r}, 0.5)"
+        assert r.to_json() is not r.to_json()
+        assert r.to_json()["runner"] == "pydemic_ui.runner.R0_rate_runner"
+
+        loaded = pickle.loads(pickle.dumps(r))
+        assert str(loaded) == str(r)
+        assert loaded.to_json() == r.to_json()
@@ -0,0 +1,45 @@
+import pickle
+
+import pytest
+
+from pydemic_ui.st_logger import Driver, Step, out, ask
+
+
+class TestDriver:
+    def test_pickle_keeps_only_pending_steps(self):
+        st = Driver([out.header("Title"), ask.slider[10](...), out.write("done")])
+        st.header("Title")
+        assert st.slider("Slider") == 10
+
+        loaded = pickle.loads(pickle.dumps(st))
+        assert list(loaded) == [out.write("done")]
+        assert not loaded.is_empty()
+
+        loaded.write("done")
+        assert loaded.is_empty()
+        assert not st.is_empty()
+
+    def test_wrong_arguments_raise_assertion_error(self):
+        st = Driver([out.write("expected")])
+        with pytest.raises(AssertionError, match="called with wrong arguments"):
+            st.write("other")
+
+    def test_wrong_method_and_empty_queue(self):
+        st = Driver([out.header("Title")])
+        with pytest.raises(AssertionError, match="expect to run"):
+            st.subheader("Title")
+        with pytest.raises(AssertionError, match="task queue is empty"):
+            st.header("Title")
+
+
+class TestSteps:
+    def test_steps_compare_and_pickle_by_fields(self):
+        step = Step("write", ("text",), {"key": 1})
+        assert step == out.write("text", key=1)
+        assert step != out.write("other", key=1)
+        assert pickle.loads(pickle.dumps(step)) == step
+
+        expect = ask.number_input[42]("Value")
+        assert expect == ask.number_input[42]("Value")
+        assert expect != ask.number_input[0]("Value")
+        assert pickle.loads(pickle.dumps(expect)) == expect
@@ -0,0 +1,64 @@
+import datetime
+
+import pandas as pd
+
+from pydemic_ui import utils
+
+
+class Series(pd.Series):
+    """
+    Subclass without a registered converter.
+    """
+
+
+class TestDataToDataframe:
+    def test_convert_supported_types(self):
+        df = pd.DataFrame({"x": [1, 2]})
+        assert utils.data_to_dataframe(df) is df
+        assert utils.data_to_dataframe(df.style) is df
+
+        data = utils.data_to_dataframe(pd.Series([1, 2]))
+        assert data.to_dict("list") == {"data": [1, 2]}
+
+        data = utils.data_to_dataframe({"x": [1, 2]})
+        assert data.to_dict("list") == {"x": [1, 2]}
+
+        data = utils.data_to_dataframe([[1, 2], [3, 4]])
+        assert data.to_numpy().tolist() == [[1, 2], [3, 4]]
+
+    def test_subclasses_use_the_converter_of_the_base_class(self):
+        data = utils.data_to_dataframe(Series([1, 2]))
+        assert isinstance(data, pd.DataFrame)
+        assert data.to_dict("list") == {"data": [1, 2]}
+        assert (
+            utils._DATAFRAME_CONVERTERS[Series] is utils._DATAFRAME_CONVERTERS[pd.Series]
+        )
+
+    def test_none_returns_a_fresh_empty_dataframe(self):
+        data = utils.data_to_dataframe(None)
+        assert data.empty
+        assert list(data.columns) == ["data"]
+
+        data["extra"] = []
+        data.loc[0] = [1, 2]
+        assert utils.data_to_dataframe(None).empty
+        assert list(utils.data_to_dataframe(None).columns) == ["data"]
+
+
+class TestNaturalDate:
+    def test_follows_current_language(self, monkeypatch):
+        date = datetime.date(2020, 5, 1)
+        monkeypatch.setenv("LC_TIME", "C")
+        monkeypatch.setenv("LANGUAGE", "pt_BR")
+        assert utils.natural_date(date) == "01/05/2020"
+        monkeypatch.setenv("LANGUAGE", "en_US")
+        assert utils.natural_date(date) == "5/1/20"
+
+    def test_memoized_dates_are_keyed_by_language(self, monkeypatch):
+        date = datetime.date(2020, 12, 25)
+        monkeypatch.setenv("LANGUAGE", "en_US")
+        assert utils.natural_date(date) == "12/25/20"
+        monkeypatch.setenv("LANGUAGE", "pt_BR")
+        assert utils.natural_date(date) == "25/12/2020"
+        monkeypatch.setenv("LANGUAGE", "en_US")
+        assert utils.natural_date(date) == "12/25/20"